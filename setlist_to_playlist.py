@@ -6,15 +6,78 @@ Supports macOS (AppleScript), Windows (COM/iTunes), and M3U export
 
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import select
 import subprocess
 import argparse
-from urllib.parse import urlparse
+import asyncio
+import atexit
+import json
+import string
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import os
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+try:
+    # orjson decodes typical API payloads several times faster than the
+    # stdlib and accepts bytes directly, skipping a decode step
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Example URL: https://www.setlist.fm/setlist/artist-name/year/venue-id.html
+_SETLIST_ID_RE = re.compile(r'setlist\.fm/setlist/[^/]+/\d+/([^/]+)\.html')
+
+
+class SetlistCache:
+    """
+    Disk cache for setlist.fm API responses, keyed by setlist ID
+    Setlists are effectively immutable once an event has happened, so
+    re-runs can skip the API call entirely and save rate-limit budget.
+    Entries expire after 30 days to pick up the rare post-show edit.
+    """
+
+    TTL_SECONDS = 30 * 24 * 60 * 60
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir if cache_dir is not None else Path.home() / ".cache" / "setlist_to_playlist"
+
+    def _entry_path(self, setlist_id: str) -> Path:
+        # Setlist IDs are alphanumeric, but sanitize just in case
+        safe_id = "".join(c for c in setlist_id if c.isalnum() or c in "-_")
+        return self.cache_dir / f"{safe_id}.json"
+
+    def get(self, setlist_id: str) -> Optional[Dict]:
+        """Return the cached response for a setlist ID, or None"""
+        path = self._entry_path(setlist_id)
+        try:
+            if time.time() - path.stat().st_mtime > self.TTL_SECONDS:
+                return None
+            return _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, setlist_id: str, data: Dict) -> None:
+        """Store a response on disk (atomic via os.replace)"""
+        path = self._entry_path(setlist_id)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(json.dumps(data, separators=(',', ':')), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            # Caching is best-effort; a read-only home dir shouldn't break the run
+            pass
+
 
 class SetlistFMClient:
     """Client for interacting with the setlist.fm API"""
@@ -27,48 +90,159 @@ class SetlistFMClient:
             "x-api-key": api_key,
             "Accept": "application/json"
         }
+        # Persistent session: reuses TCP/TLS connections across requests
+        # and retries transient failures with exponential backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.cache = SetlistCache()
+        self._aio_session = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def extract_setlist_id(self, url: str) -> Optional[str]:
         """Extract setlist ID from a setlist.fm URL"""
-        # Example URL: https://www.setlist.fm/setlist/artist-name/year/venue-id.html
-        pattern = r'setlist\.fm/setlist/[^/]+/\d+/([^/]+)\.html'
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-        return None
+        match = _SETLIST_ID_RE.search(url)
+        return match.group(1) if match else None
 
     def get_setlist(self, setlist_id: str) -> Dict:
-        """Fetch setlist data from the API"""
+        """Fetch setlist data from the API, using the disk cache if fresh"""
+        cached = self.cache.get(setlist_id)
+        if cached is not None:
+            return cached
         url = f"{self.BASE_URL}/setlist/{setlist_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, timeout=(5, 30))
         response.raise_for_status()
-        return response.json()
+        data = _json_loads(response.content)
+        self.cache.put(setlist_id, data)
+        return data
+
+    async def aget_setlist(self, setlist_id: str) -> Dict:
+        """Async variant of get_setlist for concurrent batch fetching"""
+        cached = self.cache.get(setlist_id)
+        if cached is not None:
+            return cached
+
+        import aiohttp
+        if self._aio_session is None:
+            # One session for the whole batch: connections (and TLS
+            # handshakes) are shared across all concurrent fetches
+            self._aio_session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            )
+
+        url = f"{self.BASE_URL}/setlist/{setlist_id}"
+        async with self._aio_session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            response.raise_for_status()
+            data = _json_loads(await response.read())
+        self.cache.put(setlist_id, data)
+        return data
+
+    def get_setlists(self, setlist_ids: List[str]) -> List[Dict]:
+        """Fetch multiple setlists concurrently via aiohttp"""
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "aiohttp package required for batch fetching.\n"
+                "Install it with: pip install aiohttp"
+            )
+
+        async def _fetch_all():
+            try:
+                return await asyncio.gather(*(self.aget_setlist(sid) for sid in setlist_ids))
+            finally:
+                if self._aio_session is not None:
+                    await self._aio_session.close()
+                    self._aio_session = None
+
+        return asyncio.run(_fetch_all())
+
+    def _iter_songs(self, setlist_data: Dict):
+        """Yield (name, artist) tuples from setlist data"""
+        artist_name = setlist_data.get("artist", {}).get("name", "Unknown Artist")
+        for set_item in setlist_data.get("sets", {}).get("set", ()):
+            for song in set_item.get("song", ()):
+                # Covers credit the original artist
+                cover = song.get("cover")
+                yield song.get("name", ""), cover.get("name", artist_name) if cover else artist_name
 
-    def parse_songs(self, setlist_data: Dict) -> tuple[List[Dict[str, str]], str, str]:
+    def parse_songs(self, setlist_data: Dict) -> tuple[List[tuple[str, str]], str, str]:
         """
-        Parse songs from setlist data
+        Parse songs from setlist data as (name, artist) tuples
         Returns: (songs, artist_name, event_date)
         """
-        songs = []
         artist_name = setlist_data.get("artist", {}).get("name", "Unknown Artist")
         event_date = setlist_data.get("eventDate", "")
-        venue_name = setlist_data.get("venue", {}).get("name", "")
+        return list(self._iter_songs(setlist_data)), artist_name, event_date
 
-        # Parse sets
-        for set_item in setlist_data.get("sets", {}).get("set", []):
-            for song in set_item.get("song", []):
-                song_info = {
-                    "name": song.get("name", ""),
-                    "artist": artist_name
-                }
 
-                # Check if it's a cover
-                if "cover" in song:
-                    song_info["artist"] = song["cover"].get("name", artist_name)
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
 
-                songs.append(song_info)
 
-        return songs, artist_name, event_date
+def _normalize(text: str) -> str:
+    """Lowercase, strip punctuation, and collapse whitespace"""
+    return " ".join(text.lower().translate(_PUNCTUATION_TABLE).split())
+
+
+class NotFoundCache:
+    """
+    Persistent cache of songs known to be missing from the music library
+    Lets repeat runs skip the expensive library search for songs that were
+    already confirmed unavailable.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path if path is not None else Path.home() / ".setlist_to_playlist_notfound.json"
+        self._entries: set = set()
+        self._dirty = False
+        try:
+            self._entries = set(json.loads(self.path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _key(artist: str, title: str) -> str:
+        return f"{_normalize(artist)}|{_normalize(title)}"
+
+    def contains(self, artist: str, title: str) -> bool:
+        """Check whether a song is a known miss"""
+        return self._key(artist, title) in self._entries
+
+    def add(self, artist: str, title: str) -> None:
+        """Record a song as not found"""
+        self._entries.add(self._key(artist, title))
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk (atomic via os.replace)"""
+        if not self._dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp_path.write_text(json.dumps(sorted(self._entries)), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: could not save not-found cache: {e}")
 
 
 class MusicController(ABC):
@@ -84,16 +258,130 @@ class MusicController(ABC):
         """Search for and add a song to the playlist"""
         pass
 
+    def search_and_add_song_status(self, playlist_name: str, song_name: str, artist_name: str) -> str:
+        """
+        Search for and add a song, returning a status string:
+        "success", "not found", or "error"
+        """
+        return "success" if self.search_and_add_song(playlist_name, song_name, artist_name) else "error"
+
+    def search_and_add_songs(self, playlist_name: str, songs: List[tuple[str, str]],
+                             not_found_cache: Optional[NotFoundCache] = None) -> tuple[int, int]:
+        """
+        Search for and add multiple songs to the playlist
+        Songs already recorded as misses in not_found_cache are skipped
+        without a library search; new misses are added to the cache.
+        Returns: (successful, failed) counts
+        """
+        successful = 0
+        failed = 0
+        misses_this_run = set()
+        for name, artist in songs:
+            if not_found_cache is not None and not_found_cache.contains(artist, name):
+                print(f"  ✗ Cached miss: {name} - {artist}")
+                failed += 1
+                continue
+            key = (_normalize(name), _normalize(artist))
+            if key in misses_this_run:
+                # Repeated song already confirmed missing; skip the re-search
+                print(f"  ✗ Not found: {name} - {artist}")
+                failed += 1
+                continue
+            status = self.search_and_add_song_status(playlist_name, name, artist)
+            if status == "success":
+                successful += 1
+            else:
+                failed += 1
+                if status == "not found":
+                    misses_this_run.add(key)
+                    if not_found_cache is not None:
+                        not_found_cache.add(artist, name)
+        return successful, failed
+
+
+# Escapes double quotes and backslashes for AppleScript string literals
+# in a single C-level pass (str.replace would scan and allocate twice)
+_APPLESCRIPT_ESCAPE = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+# ASCII record separator: joins batch result rows so the whole result
+# stays on one line and survives the persistent co-process channel,
+# which can only round-trip single-line results
+_BATCH_ROW_SEP = "\x1e"
+
+# Static AppleScript scaffolding, substituted with pre-escaped values so
+# the per-call work is a single C-level format instead of rebuilding the
+# whole script from an f-string
+_CREATE_PLAYLIST_TMPL = '''
+tell application "Music"
+    if not (exists playlist "%s") then
+        make new playlist with properties {name:"%s"}
+    end if
+end tell
+'''
+
+_SEARCH_TMPL = '''
+tell application "Music"
+    try
+        set searchResults to search playlist "Library" for "%s %s"
+        if (count of searchResults) > 0 then
+            set theTrack to item 1 of searchResults
+            duplicate theTrack to playlist "%s"
+            return "success"
+        else
+            return "not found"
+        end if
+    on error errMsg
+        return "error: " & errMsg
+    end try
+end tell
+'''
+
 
 class AppleMusicMacController(MusicController):
     """Controller for Apple Music on macOS via AppleScript"""
 
-    @staticmethod
-    def run_applescript(script: str) -> str:
+    # Evaluated by the co-process after each submitted script so the
+    # reader knows where one result ends
+    _SENTINEL = "__SETLIST_SCRIPT_DONE__"
+
+    # How long to wait for the co-process to finish one script before
+    # declaring it wedged
+    _PROC_TIMEOUT = 120
+
+    def __init__(self, persistent: bool = False):
+        # A long-lived osascript co-process amortizes the ~50-200 ms
+        # interpreter start-up across many scripts; opt-in (experimental)
+        # because a single-setlist run only issues a couple of invocations
+        self._persistent = persistent
+        self._proc = None
+
+    def _get_proc(self):
+        """Get the persistent osascript co-process, (re)spawning if needed"""
+        if self._proc is None or self._proc.poll() is not None:
+            # stderr is merged into stdout so compile errors land in the
+            # lines we read back instead of disappearing (or deadlocking
+            # an unread pipe)
+            self._proc = subprocess.Popen(
+                ["osascript", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
+            )
+        return self._proc
+
+    def run_applescript(self, script: str) -> str:
         """Execute an AppleScript command"""
+        if self._persistent:
+            return self._run_persistent(script)
         try:
+            # Feed the script via stdin ("-" flag) rather than -e: avoids
+            # an argv copy and the argv size ceiling, which matters for
+            # the batched multi-song scripts
             result = subprocess.run(
-                ["osascript", "-e", script],
+                ["osascript", "-"],
+                input=script,
                 capture_output=True,
                 text=True,
                 check=True
@@ -103,16 +391,116 @@ class AppleMusicMacController(MusicController):
             print(f"AppleScript error: {e.stderr}")
             raise
 
+    @staticmethod
+    def _to_one_line(script: str) -> str:
+        """
+        Wrap a multi-line script in a single-line `run script "..."`
+        Interactive osascript compiles its input line by line, so a bare
+        multi-line tell block would never compile as a unit; run script
+        with the newlines escaped into the string literal sidesteps that.
+        """
+        escaped = script.strip().replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'run script "{escaped}"'
+
+    def _read_result_lines(self, proc) -> List[str]:
+        """
+        Read co-process output up to the sentinel
+        Raises RuntimeError if the co-process dies or stops responding so
+        callers can fall back to one-shot osascript.
+        """
+        lines = []
+        deadline = time.monotonic() + self._PROC_TIMEOUT
+        fd = proc.stdout.fileno()
+        buffer = ""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.close()
+                raise RuntimeError("osascript co-process stopped responding")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 4096).decode("utf-8", errors="replace")
+            if not chunk:
+                self._proc = None
+                raise RuntimeError(
+                    "osascript co-process exited unexpectedly: " + " / ".join(lines[-3:])
+                )
+            buffer += chunk
+            while "\n" in buffer:
+                line, buffer = buffer.split("\n", 1)
+                # Interactive mode prefixes output with a prompt and may
+                # echo results in source form (quoted), so match loosely
+                if self._SENTINEL in line:
+                    return lines
+                lines.append(line.rstrip())
+
+    def _run_persistent(self, script: str) -> str:
+        """
+        Execute a script on the long-lived osascript co-process
+        The script goes in as one run script line followed by a sentinel
+        expression; everything echoed before the sentinel belongs to this
+        script, and the last such line is its result.
+        """
+        proc = self._get_proc()
+        try:
+            proc.stdin.write(self._to_one_line(script) + "\n" + f'"{self._SENTINEL}"\n')
+            proc.stdin.flush()
+        except OSError as e:
+            self._proc = None
+            raise RuntimeError(f"osascript co-process is gone: {e}")
+        lines = self._read_result_lines(proc)
+        if not lines:
+            return ""
+        result = lines[-1].lstrip("»> ").strip()
+        lowered = result.lower()
+        if "syntax error" in lowered or "execution error" in lowered:
+            raise RuntimeError(f"osascript co-process reported: {result}")
+        return self._unquote_result(result)
+
+    @staticmethod
+    def _unquote_result(line: str) -> str:
+        """
+        Undo source-form echoing of a string result
+        Interactive osascript may echo results as quoted source text, so
+        strip the quotes and process the escapes left-to-right (a naive
+        chain of str.replace would mangle sequences like backslash-n).
+        """
+        if len(line) < 2 or not (line.startswith('"') and line.endswith('"')):
+            return line
+        body = line[1:-1]
+        out = []
+        i = 0
+        while i < len(body):
+            c = body[i]
+            if c == "\\" and i + 1 < len(body):
+                out.append({"n": "\n", "t": "\t", "r": "\r"}.get(body[i + 1], body[i + 1]))
+                i += 2
+            else:
+                out.append(c)
+                i += 1
+        return "".join(out)
+
+    def close(self) -> None:
+        """Shut down the osascript co-process, if one is running"""
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+        self._proc = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def create_playlist(self, name: str) -> None:
         """Create a new playlist in Apple Music"""
-        script = f'''
-        tell application "Music"
-            if not (exists playlist "{name}") then
-                make new playlist with properties {{name:"{name}"}}
-            end if
-        end tell
-        '''
-        self.run_applescript(script)
+        name_escaped = name.translate(_APPLESCRIPT_ESCAPE)
+        self.run_applescript(_CREATE_PLAYLIST_TMPL % (name_escaped, name_escaped))
         print(f"Created playlist: {name}")
 
     def search_and_add_song(self, playlist_name: str, song_name: str, artist_name: str) -> bool:
@@ -120,41 +508,166 @@ class AppleMusicMacController(MusicController):
         Search for a song in Apple Music and add it to the playlist
         Returns True if successful, False otherwise
         """
-        # Escape quotes in song and artist names
-        song_name_escaped = song_name.replace('"', '\\"')
-        artist_name_escaped = artist_name.replace('"', '\\"')
+        return self.search_and_add_song_status(playlist_name, song_name, artist_name) == "success"
 
-        script = f'''
-        tell application "Music"
-            try
-                set searchResults to search playlist "Library" for "{song_name_escaped} {artist_name_escaped}"
-                if (count of searchResults) > 0 then
-                    set theTrack to item 1 of searchResults
-                    duplicate theTrack to playlist "{playlist_name}"
-                    return "success"
-                else
-                    return "not found"
-                end if
-            on error errMsg
-                return "error: " & errMsg
-            end try
-        end tell
-        '''
+    def search_and_add_song_status(self, playlist_name: str, song_name: str, artist_name: str) -> str:
+        """
+        Search for a song in Apple Music and add it to the playlist
+        Returns "success", "not found", or "error"
+        """
+        # Escape quotes and backslashes in everything interpolated into the script
+        song_name_escaped = song_name.translate(_APPLESCRIPT_ESCAPE)
+        artist_name_escaped = artist_name.translate(_APPLESCRIPT_ESCAPE)
+        playlist_name_escaped = playlist_name.translate(_APPLESCRIPT_ESCAPE)
+
+        script = _SEARCH_TMPL % (song_name_escaped, artist_name_escaped, playlist_name_escaped)
 
         try:
             result = self.run_applescript(script)
             if result == "success":
                 print(f"  ✓ Added: {song_name} - {artist_name}")
-                return True
+                return "success"
             elif result == "not found":
                 print(f"  ✗ Not found: {song_name} - {artist_name}")
-                return False
+                return "not found"
             else:
                 print(f"  ✗ Error adding {song_name}: {result}")
-                return False
+                return "error"
         except Exception as e:
             print(f"  ✗ Failed to add {song_name}: {str(e)}")
-            return False
+            return "error"
+
+    def search_and_add_songs(self, playlist_name: str, songs: List[tuple[str, str]],
+                             not_found_cache: Optional[NotFoundCache] = None) -> tuple[int, int]:
+        """
+        Search for and add all songs with a single osascript invocation
+        Batching avoids the per-process launch overhead of one osascript
+        call per song. Falls back to per-song calls if the batch fails.
+        Returns: (successful, failed) counts
+        """
+        successful = 0
+        failed = 0
+
+        # Skip songs already known to be missing before building the script
+        if not_found_cache is not None:
+            remaining = []
+            for name, artist in songs:
+                if not_found_cache.contains(artist, name):
+                    print(f"  ✗ Cached miss: {name} - {artist}")
+                    failed += 1
+                else:
+                    remaining.append((name, artist))
+            songs = remaining
+
+        if not songs:
+            return successful, failed
+
+        playlist_name_escaped = playlist_name.translate(_APPLESCRIPT_ESCAPE)
+
+        # Collapse repeated songs (reprises, medleys): each unique song is
+        # searched once and the found track is duplicated once per occurrence
+        unique_songs = []
+        occurrence_index = {}
+        for name, artist in songs:
+            key = (_normalize(name), _normalize(artist))
+            if key in occurrence_index:
+                unique_songs[occurrence_index[key]][1] += 1
+            else:
+                occurrence_index[key] = len(unique_songs)
+                unique_songs.append([(name, artist), 1])
+
+        # Encode each song as "name|artist|count": the delimiter is
+        # substituted away, quotes and backslashes are escaped for the
+        # AppleScript string literal (same table as the per-song path)
+        queries = []
+        for (name, artist), count in unique_songs:
+            name = name.replace('|', '/').translate(_APPLESCRIPT_ESCAPE)
+            artist = artist.replace('|', '/').translate(_APPLESCRIPT_ESCAPE)
+            queries.append(f'"{name}|{artist}|{count}"')
+        query_list = ", ".join(queries)
+
+        script = f'''
+        tell application "Music"
+            set queries to {{{query_list}}}
+            set output to {{}}
+            repeat with q in queries
+                set AppleScript's text item delimiters to "|"
+                set parts to text items of q
+                set songName to item 1 of parts
+                set artistName to item 2 of parts
+                set copiesNeeded to (item 3 of parts) as integer
+                try
+                    set searchResults to search playlist "Library" for (songName & " " & artistName)
+                    if (count of searchResults) > 0 then
+                        repeat copiesNeeded times
+                            duplicate (item 1 of searchResults) to playlist "{playlist_name_escaped}"
+                        end repeat
+                        set end of output to "ok" & tab & q
+                    else
+                        set end of output to "miss" & tab & q
+                    end if
+                on error errMsg
+                    -- flatten linefeeds in errMsg so positional matching
+                    -- of output lines stays aligned
+                    set AppleScript's text item delimiters to linefeed
+                    set errParts to text items of errMsg
+                    set AppleScript's text item delimiters to " "
+                    set errMsg to errParts as text
+                    set end of output to "error" & tab & q & tab & errMsg
+                end try
+            end repeat
+            set AppleScript's text item delimiters to (character id 30)
+            return output as text
+        end tell
+        '''
+
+        try:
+            result = self.run_applescript(script)
+        except Exception:
+            # Fall back to the single-song path; if the persistent
+            # co-process is what failed, the fallback must not route
+            # through it again
+            self._persistent = False
+            batch_ok, batch_failed = super().search_and_add_songs(playlist_name, songs, not_found_cache)
+            return successful + batch_ok, failed + batch_failed
+
+        rows = result.split(_BATCH_ROW_SEP) if result else []
+        if len(rows) != len(unique_songs):
+            # The result didn't round-trip intact, so positional matching
+            # would misattribute statuses and could poison the not-found
+            # cache. The script may already have executed, so re-running
+            # would duplicate adds; report the batch as failed and stop
+            # trusting the persistent channel for later calls.
+            self._persistent = False
+            print(f"  ✗ Batch result corrupted ({len(rows)} rows for {len(unique_songs)} songs)")
+            for (name, artist), count in unique_songs:
+                print(f"  ✗ Error adding {name}: batch result corrupted")
+                failed += count
+            return successful, failed
+
+        for ((name, artist), count), row in zip(unique_songs, rows):
+            status = row.split("\t", 1)[0]
+            if status == "ok":
+                for _ in range(count):
+                    print(f"  ✓ Added: {name} - {artist}")
+                successful += count
+            elif status == "miss":
+                for _ in range(count):
+                    print(f"  ✗ Not found: {name} - {artist}")
+                failed += count
+                if not_found_cache is not None:
+                    not_found_cache.add(artist, name)
+            else:
+                detail = row.split("\t", 2)[-1]
+                print(f"  ✗ Error adding {name}: {detail}")
+                failed += count
+        return successful, failed
+
+
+@lru_cache(maxsize=256)
+def _search_query(song_name: str, artist_name: str) -> str:
+    """Build the library search query for a song, cached across repeats"""
+    return f"{song_name} {artist_name}"
 
 
 class AppleMusicWindowsController(MusicController):
@@ -163,8 +676,12 @@ class AppleMusicWindowsController(MusicController):
     def __init__(self):
         try:
             import win32com.client
+            import pythoncom
             self.win32com = win32com.client
-            self.itunes = None
+            self.pythoncom = pythoncom
+            # COM objects are apartment-threaded, so each thread gets its
+            # own dispatch via thread-local storage
+            self._local = threading.local()
             self.app_name = None
         except ImportError:
             raise ImportError(
@@ -173,8 +690,9 @@ class AppleMusicWindowsController(MusicController):
             )
 
     def _get_itunes(self):
-        """Get Apple Music/iTunes COM object"""
-        if self.itunes is None:
+        """Get the Apple Music/iTunes COM object for the current thread"""
+        itunes = getattr(self._local, "itunes", None)
+        if itunes is None:
             # List of COM identifiers to try, in order of preference
             com_identifiers = [
                 ("AppleMusic.Application", "Apple Music"),
@@ -184,13 +702,15 @@ class AppleMusicWindowsController(MusicController):
             last_error = None
             for com_id, app_name in com_identifiers:
                 try:
-                    self.itunes = self.win32com.Dispatch(com_id)
-                    self.app_name = app_name
-                    print(f"✓ Connected to {app_name}")
-                    return self.itunes
+                    itunes = self.win32com.Dispatch(com_id)
                 except Exception as e:
                     last_error = e
                     continue
+                self._local.itunes = itunes
+                if self.app_name is None:
+                    self.app_name = app_name
+                    print(f"✓ Connected to {app_name}")
+                return itunes
 
             # If we get here, none of the COM objects worked
             error_msg = (
@@ -206,24 +726,64 @@ class AppleMusicWindowsController(MusicController):
             )
             raise RuntimeError(error_msg)
 
-        return self.itunes
+        return itunes
+
+    def _get_playlist_cache(self) -> Dict[str, Any]:
+        """Get the per-thread playlist cache, creating it on first use"""
+        cache = getattr(self._local, "playlist_cache", None)
+        if cache is None:
+            cache = self._local.playlist_cache = {}
+        return cache
+
+    def _get_library_playlist(self, app) -> Any:
+        """Get the library playlist, cached per thread"""
+        library_playlist = getattr(self._local, "library_playlist", None)
+        if library_playlist is None:
+            library_playlist = self._local.library_playlist = app.LibraryPlaylist
+        return library_playlist
+
+    def _find_playlist(self, app, playlist_name: str) -> Optional[Any]:
+        """
+        Find a playlist by name, cached per thread
+        Goes straight to the library source via LibraryPlaylist.Source
+        instead of enumerating app.Sources, and prefers ItemByName over a
+        linear scan; every enumerated item is a COM marshal.
+        """
+        cache = self._get_playlist_cache()
+        playlist = cache.get(playlist_name)
+        if playlist is not None:
+            return playlist
+
+        playlists = self._get_library_playlist(app).Source.Playlists
+        try:
+            playlist = playlists.ItemByName(playlist_name)
+        except Exception:
+            playlist = None
+        if playlist is None:
+            # Fall back to a single linear pass (cached afterwards)
+            for candidate in playlists:
+                if candidate.Name == playlist_name:
+                    playlist = candidate
+                    break
+        if playlist is not None:
+            cache[playlist_name] = playlist
+        return playlist
 
     def create_playlist(self, name: str) -> None:
         """Create a new playlist in Apple Music/iTunes"""
         app = self._get_itunes()
 
         # Check if playlist exists
-        sources = app.Sources
-        for source in sources:
-            if source.Kind == 1:  # Library
-                playlists = source.Playlists
-                for playlist in playlists:
-                    if playlist.Name == name:
-                        print(f"Playlist already exists: {name}")
-                        return
+        if self._find_playlist(app, name) is not None:
+            print(f"Playlist already exists: {name}")
+            return
 
         # Create new playlist
-        app.CreatePlaylist(name)
+        try:
+            app.CreatePlaylist(name)
+        except Exception:
+            self._get_playlist_cache().pop(name, None)
+            raise
         print(f"Created playlist: {name}")
 
     def search_and_add_song(self, playlist_name: str, song_name: str, artist_name: str) -> bool:
@@ -231,75 +791,136 @@ class AppleMusicWindowsController(MusicController):
         Search for a song and add it to the playlist
         Returns True if successful, False otherwise
         """
+        return self.search_and_add_song_status(playlist_name, song_name, artist_name) == "success"
+
+    def search_and_add_song_status(self, playlist_name: str, song_name: str, artist_name: str) -> str:
+        """
+        Search for a song and add it to the playlist
+        Returns "success", "not found", or "error"
+        """
         try:
             app = self._get_itunes()
 
-            # Find the playlist
-            target_playlist = None
-            sources = app.Sources
-            for source in sources:
-                if source.Kind == 1:  # Library
-                    playlists = source.Playlists
-                    for playlist in playlists:
-                        if playlist.Name == playlist_name:
-                            target_playlist = playlist
-                            break
-                if target_playlist:
-                    break
-
+            # Find the playlist (cached after the first lookup per thread)
+            target_playlist = self._find_playlist(app, playlist_name)
             if not target_playlist:
                 print(f"  ✗ Playlist not found: {playlist_name}")
-                return False
+                return "error"
+
+            # Repeated songs reuse the already-located track instead of
+            # paying another library search
+            track_cache = getattr(self._local, "track_cache", None)
+            if track_cache is None:
+                track_cache = self._local.track_cache = {}
+            track_key = (_normalize(song_name), _normalize(artist_name))
+            cached_track = track_cache.get(track_key)
+            if cached_track is not None:
+                cached_track.AddToPlaylist(target_playlist)
+                print(f"  ✓ Added: {song_name} - {artist_name}")
+                return "success"
 
             # Search for the track
-            search_query = f"{song_name} {artist_name}"
-            library_playlist = app.LibraryPlaylist
+            search_query = _search_query(song_name, artist_name)
+            library_playlist = self._get_library_playlist(app)
             search_results = library_playlist.Search(search_query, 0)  # 0 = search all fields
 
             if search_results and search_results.Count > 0:
                 track = search_results.Item(1)  # Get first result (COM uses 1-based indexing)
+                track_cache[track_key] = track
                 track.AddToPlaylist(target_playlist)
                 print(f"  ✓ Added: {song_name} - {artist_name}")
-                return True
+                return "success"
             else:
                 print(f"  ✗ Not found: {song_name} - {artist_name}")
-                return False
+                return "not found"
 
         except Exception as e:
             print(f"  ✗ Error adding {song_name}: {str(e)}")
-            return False
+            return "error"
+
+    def search_and_add_songs(self, playlist_name: str, songs: List[tuple[str, str]],
+                             not_found_cache: Optional[NotFoundCache] = None) -> tuple[int, int]:
+        """
+        Search for and add multiple songs to the playlist
+        Searches are I/O-bound COM round-trips, so they run on a small
+        thread pool; each worker initializes its own COM apartment and
+        gets its own dispatch through thread-local storage.
+        Returns: (successful, failed) counts
+        """
+        # Connect on the main thread first so connection errors surface
+        # before any workers start
+        self._get_itunes()
+
+        successful = 0
+        failed = 0
+        to_search = []
+        for name, artist in songs:
+            if not_found_cache is not None and not_found_cache.contains(artist, name):
+                print(f"  ✗ Cached miss: {name} - {artist}")
+                failed += 1
+            else:
+                to_search.append((name, artist))
+
+        if not to_search:
+            return successful, failed
+
+        # COM is initialized once per worker thread (not per song): pool
+        # threads are reused across tasks, and uninitializing between
+        # tasks would tear down the apartment that owns the thread-local
+        # proxies cached by _get_itunes/_find_playlist. The apartments
+        # live until the pool's threads exit with the executor.
+        with ThreadPoolExecutor(max_workers=4, initializer=self.pythoncom.CoInitialize) as executor:
+            statuses = list(executor.map(
+                lambda song: self.search_and_add_song_status(playlist_name, song[0], song[1]),
+                to_search
+            ))
+
+        for (name, artist), status in zip(to_search, statuses):
+            if status == "success":
+                successful += 1
+            else:
+                failed += 1
+                if status == "not found" and not_found_cache is not None:
+                    not_found_cache.add(artist, name)
+        return successful, failed
+
+
+# Characters allowed in generated M3U filenames
+_FILENAME_KEEP = frozenset(string.ascii_letters + string.digits + " -_")
 
 
 class M3UExporter:
     """Export playlist as M3U file for manual import"""
 
     @staticmethod
-    def export_playlist(playlist_name: str, songs: List[Dict[str, str]], output_path: str = None) -> str:
+    def export_playlist(playlist_name: str, songs: List[tuple[str, str]], output_path: str = None) -> str:
         """
         Export songs to M3U playlist file
         Returns the path to the created file
         """
         if output_path is None:
             # Create safe filename
-            safe_name = "".join(c for c in playlist_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_name = "".join(c for c in playlist_name if c in _FILENAME_KEEP).rstrip()
             output_path = f"{safe_name}.m3u"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("#EXTM3U\n")
-            for song in songs:
-                # M3U format: #EXTINF:duration,artist - title
-                # Duration is unknown, so use -1
-                f.write(f"#EXTINF:-1,{song['artist']} - {song['name']}\n")
-                # We don't have actual file paths, so just write the search query
-                # This serves as a reference list
-                f.write(f"# Search: {song['name']} by {song['artist']}\n")
+        # Build the whole payload in memory and write it once
+        lines = ["#EXTM3U\n"]
+        for name, artist in songs:
+            # M3U format: #EXTINF:duration,artist - title
+            # Duration is unknown, so use -1
+            # We don't have actual file paths, so write the search query
+            # as a comment; it serves as a reference list
+            lines.append(f"#EXTINF:-1,{artist} - {name}\n# Search: {name} by {artist}\n")
+        Path(output_path).write_text("".join(lines), encoding="utf-8")
 
         return output_path
 
 
-def get_music_controller(export_only: bool = False) -> Optional[MusicController]:
+def get_music_controller(export_only: bool = False, persistent: bool = False) -> Optional[MusicController]:
     """
     Get the appropriate music controller for the current platform
+    persistent keeps a long-lived osascript co-process alive on macOS,
+    worthwhile when processing many setlists in one run.
     Returns None if export_only is True
     """
     if export_only:
@@ -307,7 +928,7 @@ def get_music_controller(export_only: bool = False) -> Optional[MusicController]
 
     if sys.platform == "darwin":
         # macOS - use AppleScript
-        return AppleMusicMacController()
+        return AppleMusicMacController(persistent=persistent)
     elif sys.platform == "win32":
         # Windows - use COM
         try:
@@ -327,101 +948,36 @@ def get_music_controller(export_only: bool = False) -> Optional[MusicController]
         return None
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Create an Apple Music playlist from a setlist.fm URL",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s "https://www.setlist.fm/setlist/artist/2024/venue-id.html"
-  %(prog)s "URL" --playlist-name "My Custom Playlist"
-  %(prog)s "URL" --export-only --output myplaylist.m3u
-
-Platform Support:
-  macOS:   Uses AppleScript to control Apple Music
-  Windows: Uses COM interface (requires iTunes or Apple Music for Windows)
-  Other:   Exports M3U file for manual import
-        """
-    )
-    parser.add_argument(
-        "url",
-        help="The setlist.fm URL"
-    )
-    parser.add_argument(
-        "--api-key",
-        help="setlist.fm API key (or set SETLISTFM_API_KEY environment variable)",
-        default=os.environ.get("SETLISTFM_API_KEY")
-    )
-    parser.add_argument(
-        "--playlist-name",
-        help="Custom playlist name (default: 'Artist - Venue - Date')"
-    )
-    parser.add_argument(
-        "--export-only",
-        action="store_true",
-        help="Only export M3U file, don't create playlist in Apple Music"
-    )
-    parser.add_argument(
-        "--output",
-        help="Output path for M3U file (only used with --export-only)"
-    )
-
-    args = parser.parse_args()
-
-    if not args.api_key:
-        print("Error: setlist.fm API key required.")
-        print("Set SETLISTFM_API_KEY environment variable or use --api-key flag")
-        print("\nGet your API key at: https://www.setlist.fm/settings/api")
-        sys.exit(1)
-
-    print(f"Fetching setlist from: {args.url}\n")
-
-    # Initialize setlist client
-    setlist_client = SetlistFMClient(args.api_key)
-
-    # Extract setlist ID from URL
-    setlist_id = setlist_client.extract_setlist_id(args.url)
-    if not setlist_id:
-        print("Error: Could not extract setlist ID from URL")
-        print("Expected format: https://www.setlist.fm/setlist/artist/year/venue-id.html")
-        sys.exit(1)
-
-    print(f"Setlist ID: {setlist_id}")
-
-    # Fetch setlist data
-    try:
-        setlist_data = setlist_client.get_setlist(setlist_id)
-    except requests.exceptions.HTTPError as e:
-        print(f"Error fetching setlist: {e}")
-        if e.response.status_code == 401:
-            print("Invalid API key. Get your key at: https://www.setlist.fm/settings/api")
-        sys.exit(1)
-
-    # Parse songs
+def process_setlist(setlist_data: Dict, setlist_client: SetlistFMClient,
+                    music_controller: Optional[MusicController],
+                    not_found_cache: NotFoundCache,
+                    playlist_name_override: Optional[str] = None,
+                    output_path: Optional[str] = None) -> bool:
+    """
+    Create or export the playlist for one fetched setlist
+    Returns True if a playlist was created or exported
+    """
     songs, artist_name, event_date = setlist_client.parse_songs(setlist_data)
 
     if not songs:
         print("No songs found in setlist")
-        sys.exit(1)
+        return False
 
     print(f"Artist: {artist_name}")
     print(f"Date: {event_date}")
     print(f"Songs found: {len(songs)}\n")
 
     # Generate playlist name
-    if args.playlist_name:
-        playlist_name = args.playlist_name
+    if playlist_name_override:
+        playlist_name = playlist_name_override
     else:
         venue = setlist_data.get("venue", {}).get("name", "Unknown Venue")
         playlist_name = f"{artist_name} - {venue} - {event_date}"
 
-    # Get music controller
-    music_controller = get_music_controller(export_only=args.export_only)
-
     if music_controller is None:
         # Export to M3U file
         print(f"Exporting playlist to M3U file: {playlist_name}\n")
-        output_path = M3UExporter.export_playlist(playlist_name, songs, args.output)
+        output_path = M3UExporter.export_playlist(playlist_name, songs, output_path)
         print(f"\n{'='*50}")
         print(f"M3U playlist exported successfully!")
         print(f"{'='*50}")
@@ -432,7 +988,7 @@ Platform Support:
         print(f"2. Go to File > Library > Import Playlist")
         print(f"3. Select the M3U file: {output_path}")
         print(f"\nNote: You'll need to manually search and add songs in Apple Music")
-        return
+        return True
 
     # Create playlist directly
     print(f"Creating playlist: {playlist_name}\n")
@@ -444,7 +1000,7 @@ Platform Support:
         print("\n" + "="*50)
         print("Switching to M3U export mode...")
         print("="*50 + "\n")
-        output_path = M3UExporter.export_playlist(playlist_name, songs, args.output)
+        output_path = M3UExporter.export_playlist(playlist_name, songs, output_path)
         print(f"\n{'='*50}")
         print(f"M3U playlist exported successfully!")
         print(f"{'='*50}")
@@ -455,18 +1011,11 @@ Platform Support:
         print(f"2. Go to File > Library > Import Playlist")
         print(f"3. Select the M3U file: {output_path}")
         print(f"\nThe M3U file contains all {len(songs)} songs from the setlist.")
-        return
+        return True
 
-    # Add songs to playlist
+    # Add songs to playlist, skipping songs already known to be missing
     print("\nAdding songs to playlist:")
-    successful = 0
-    failed = 0
-
-    for song in songs:
-        if music_controller.search_and_add_song(playlist_name, song["name"], song["artist"]):
-            successful += 1
-        else:
-            failed += 1
+    successful, failed = music_controller.search_and_add_songs(playlist_name, songs, not_found_cache)
 
     print(f"\n{'='*50}")
     print(f"Playlist creation complete!")
@@ -476,6 +1025,147 @@ Platform Support:
     print(f"Successfully added: {successful}")
     print(f"Not found/failed: {failed}")
     print(f"\nOpen Apple Music to view your playlist!")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create an Apple Music playlist from a setlist.fm URL",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s "https://www.setlist.fm/setlist/artist/2024/venue-id.html"
+  %(prog)s "URL" --playlist-name "My Custom Playlist"
+  %(prog)s "URL" --export-only --output myplaylist.m3u
+  %(prog)s --urls-file tour_urls.txt
+
+Platform Support:
+  macOS:   Uses AppleScript to control Apple Music
+  Windows: Uses COM interface (requires iTunes or Apple Music for Windows)
+  Other:   Exports M3U file for manual import
+        """
+    )
+    parser.add_argument(
+        "url",
+        nargs="?",
+        help="The setlist.fm URL"
+    )
+    parser.add_argument(
+        "--urls-file",
+        help="File with one setlist.fm URL per line; setlists are fetched concurrently (requires aiohttp)"
+    )
+    parser.add_argument(
+        "--api-key",
+        help="setlist.fm API key (or set SETLISTFM_API_KEY environment variable)",
+        default=os.environ.get("SETLISTFM_API_KEY")
+    )
+    parser.add_argument(
+        "--playlist-name",
+        help="Custom playlist name (default: 'Artist - Venue - Date')"
+    )
+    parser.add_argument(
+        "--export-only",
+        action="store_true",
+        help="Only export M3U file, don't create playlist in Apple Music"
+    )
+    parser.add_argument(
+        "--output",
+        help="Output path for M3U file (only used with --export-only)"
+    )
+    parser.add_argument(
+        "--persistent-osascript",
+        action="store_true",
+        help="Keep one osascript process alive across scripts (macOS only, experimental; "
+             "can speed up multi-setlist runs)"
+    )
+
+    args = parser.parse_args()
+
+    if not args.api_key:
+        print("Error: setlist.fm API key required.")
+        print("Set SETLISTFM_API_KEY environment variable or use --api-key flag")
+        print("\nGet your API key at: https://www.setlist.fm/settings/api")
+        sys.exit(1)
+
+    if not args.url and not args.urls_file:
+        parser.error("a setlist.fm URL or --urls-file is required")
+
+    # Collect URLs (single argument or one per line in --urls-file)
+    if args.urls_file:
+        try:
+            lines = Path(args.urls_file).read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            print(f"Error reading URLs file: {e}")
+            sys.exit(1)
+        urls = [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+        if not urls:
+            print(f"No URLs found in: {args.urls_file}")
+            sys.exit(1)
+    else:
+        urls = [args.url]
+
+    # Resolve the platform controller before the API fetch: an unsupported
+    # platform or missing pywin32 shouldn't cost a network call and
+    # rate-limit budget first
+    music_controller = get_music_controller(
+        export_only=args.export_only,
+        persistent=args.persistent_osascript
+    )
+
+    # Initialize setlist client
+    with SetlistFMClient(args.api_key) as setlist_client:
+        # Extract setlist IDs from URLs
+        setlist_ids = []
+        for url in urls:
+            setlist_id = setlist_client.extract_setlist_id(url)
+            if not setlist_id:
+                print(f"Error: Could not extract setlist ID from URL: {url}")
+                print("Expected format: https://www.setlist.fm/setlist/artist/year/venue-id.html")
+                sys.exit(1)
+            setlist_ids.append(setlist_id)
+
+        # Fetch setlist data
+        if len(setlist_ids) > 1:
+            print(f"Fetching {len(setlist_ids)} setlists concurrently...\n")
+            try:
+                setlists = setlist_client.get_setlists(setlist_ids)
+            except ImportError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            except Exception as e:
+                print(f"Error fetching setlists: {e}")
+                sys.exit(1)
+        else:
+            print(f"Fetching setlist from: {urls[0]}\n")
+            print(f"Setlist ID: {setlist_ids[0]}")
+            try:
+                setlists = [setlist_client.get_setlist(setlist_ids[0])]
+            except requests.exceptions.RequestException as e:
+                # Covers HTTPError as well as RetryError (retries
+                # exhausted) and connection failures
+                print(f"Error fetching setlist: {e}")
+                if (isinstance(e, requests.exceptions.HTTPError)
+                        and e.response is not None
+                        and e.response.status_code == 401):
+                    print("Invalid API key. Get your key at: https://www.setlist.fm/settings/api")
+                sys.exit(1)
+
+        not_found_cache = NotFoundCache()
+        atexit.register(not_found_cache.save)
+
+        # A custom name or output path only makes sense for a single setlist
+        single = len(setlists) == 1
+        any_created = False
+        for setlist_data in setlists:
+            created = process_setlist(
+                setlist_data, setlist_client, music_controller, not_found_cache,
+                playlist_name_override=args.playlist_name if single else None,
+                output_path=args.output if single else None
+            )
+            any_created = created or any_created
+
+    if not any_created:
+        sys.exit(1)
 
 
 if __name__ == "__main__":